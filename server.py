@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import json
 import time
 from mcp.server.fastmcp import FastMCP
@@ -7,6 +7,10 @@ mcp = FastMCP("simple-server")
 
 # Simple in-memory storage
 notes_storage = []
+# Tag -> notes carrying that tag, in insertion order
+tag_index: Dict[str, List[Dict[str, Any]]] = {}
+# Lowercased (title, content) per note, parallel to notes_storage
+search_keys: List[Tuple[str, str]] = []
 
 @mcp.tool()
 def add_note(title: str, content: str, tags: List[str] = None) -> Dict[str, Any]:
@@ -22,13 +26,16 @@ def add_note(title: str, content: str, tags: List[str] = None) -> Dict[str, Any]
         "created_at": time.time()
     }
     notes_storage.append(note)
+    search_keys.append((title.lower(), content.lower()))
+    for tag in set(note["tags"]):
+        tag_index.setdefault(tag, []).append(note)
     return {"success": True, "note": note}
 
 @mcp.tool()
 def list_notes(tag_filter: str = None) -> Dict[str, Any]:
     """List all notes, optionally filtered by tag."""
     if tag_filter:
-        filtered_notes = [note for note in notes_storage if tag_filter in note.get("tags", [])]
+        filtered_notes = tag_index.get(tag_filter, [])
         return {"notes": filtered_notes, "count": len(filtered_notes), "filter": tag_filter}
     
     return {"notes": notes_storage, "count": len(notes_storage)}
@@ -41,8 +48,8 @@ def search_notes(query: str) -> Dict[str, Any]:
     
     query_lower = query.lower()
     matching_notes = [
-        note for note in notes_storage 
-        if query_lower in note["title"].lower() or query_lower in note["content"].lower()
+        note for note, (title_lower, content_lower) in zip(notes_storage, search_keys)
+        if query_lower in title_lower or query_lower in content_lower
     ]
     
     return {"notes": matching_notes, "count": len(matching_notes), "query": query}